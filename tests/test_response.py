@@ -75,9 +75,10 @@ class TestResponse:
 
         api.register_blueprint(blp)
 
-        get_1 = api.spec.to_dict()["paths"]["/test/route_1"]["get"]
+        paths = api.spec.to_dict()["paths"]
+        get_1 = paths["/test/route_1"]["get"]
         assert get_1["responses"]["204"]["description"] == http.HTTPStatus(204).phrase
-        get_2 = api.spec.to_dict()["paths"]["/test/route_2"]["get"]
+        get_2 = paths["/test/route_2"]["get"]
         assert get_2["responses"]["204"]["description"] == "Test"
 
     @pytest.mark.parametrize("openapi_version", ("2.0", "3.0.2"))
@@ -31,6 +31,11 @@ def get_headers(spec):
     return spec.to_dict()["components"]["headers"]
 
 
+def get_path_item(spec, path):
+    # Avoid serializing the whole spec when only one path is needed
+    return spec._paths[path]
+
+
 def build_ref(spec, component_type, obj):
     return build_reference(component_type, spec.openapi_version.major, obj)
 